@@ -1,18 +1,20 @@
 import sys
 import os
-import json
+import re
 import threading
-import webbrowser
+import queue
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urljoin
 
 # Fix for PyAppify: PySide6 requires PATH environment variable
 if 'PATH' not in os.environ:
     os.environ['PATH'] = ''
 
-import requests
-from PySide6.QtCore import Signal, QObject, Qt
+from PySide6.QtCore import (
+    Signal, QObject, Qt, QTimer, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+)
 from PySide6.QtGui import QShortcut, QKeySequence
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QSizePolicy
@@ -22,56 +24,255 @@ from qfluentwidgets import (
     StrongBodyLabel, CardWidget, ScrollArea, InfoBar,
     InfoBarPosition, setTheme, Theme, FluentIcon,
     NavigationItemPosition, SubtitleLabel, TitleLabel,
-    SearchLineEdit, ComboBox
+    SearchLineEdit, ComboBox, ListView, RoundMenu, Action
 )
 from qfluentwidgets.window import FluentWindow
 
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+try:
+    import ijson
+    _PARSE_ERRORS = (ValueError, KeyError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _PARSE_ERRORS = (ValueError, KeyError)
+
+# 固定的 HTTP 错误提示；404 需带上端点地址，在分支内单独格式化
+_STATIC_ERRS = {401: "认证失败：API密钥无效或缺失", 500: "服务器内部错误"}
+# 流式与整体解析两条路径共用，保证同一响应得到相同的错误
+_ITEM_FORMAT_ERR = "响应格式错误：'data'中的条目不是对象"
+
+# 可选的 userinfo（代理认证等）+ 主机 + 可选端口（允许为空，与 urlparse 一致）
+_URL_RE = re.compile(r'^https?://(?:[^/\s?#@]+@)?(?:\[[0-9a-f:.]+\]|[^/:\s?#@]+)(?::\d*)?(?:[/?#]\S*)?$',
+                     re.IGNORECASE)
+
+_CONFIG_DIR = Path.home() / ".openai_model_fetcher"
+_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
 
 class APIError(Exception):
     pass
 
 
+# 常驻的守护工作线程，从队列取任务，避免每次获取都新建线程。
+# 不用 ThreadPoolExecutor：其工作线程会在解释器退出时被等待，
+# 窗口关闭后进程可能被进行中的请求拖住
+_MAX_WORKERS = 4
+_TASKS = queue.SimpleQueue()
+_workers_started = False
+_workers_lock = threading.Lock()
+
+
+def _worker():
+    while True:
+        future, fn, args = _TASKS.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+
+def _submit(fn, *args) -> Future:
+    """把 fn 交给工作线程执行并返回 Future；首次调用时启动工作线程"""
+    global _workers_started
+    if not _workers_started:
+        with _workers_lock:
+            if not _workers_started:
+                for i in range(_MAX_WORKERS):
+                    threading.Thread(target=_worker, name=f"fetch-{i}", daemon=True).start()
+                _workers_started = True
+    future = Future()
+    _TASKS.put((future, fn, args))
+    return future
+
+
+def _stream_model_ids(stream) -> list:
+    """边读边解析响应，只保留 data[*].id，不构建完整的响应对象"""
+    ids, has_data, current = [], False, None
+    append = ids.append
+    for prefix, event, value in ijson.parse(stream):
+        if prefix == 'data.item.id':
+            current = value
+        elif prefix == 'data.item':
+            if event == 'start_map':
+                current = "Unknown"
+            elif event == 'end_map':
+                append(current)
+            elif event != 'map_key':
+                # 条目本身是数组或标量，而非对象
+                raise APIError(_ITEM_FORMAT_ERR)
+        elif prefix == 'data' and event == 'start_array':
+            has_data = True
+    if not has_data:
+        raise APIError("响应格式错误：缺少有效的'data'字段")
+    return ids
+
+
+def _extract_model_ids(payload) -> list:
+    """从已解析的响应中校验并提取 data[*].id"""
+    models = payload.get('data') if isinstance(payload, dict) else None
+    if not isinstance(models, list):
+        raise APIError("响应格式错误：缺少有效的'data'字段")
+    if not all(isinstance(m, dict) for m in models):
+        raise APIError(_ITEM_FORMAT_ERR)
+    return [m.get("id", "Unknown") for m in models]
+
+
+def _build_session():
+    # requests 连带 urllib3/idna/certifi 等导入较慢，推迟到首次请求
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # 只重试 status_forcelist 中的状态码；连接失败与读超时直接抛出，
+    # 否则每次都要等满多轮超时，且读超时会被包装成连接错误。
+    # 忽略 Retry-After：维护页常带很长的等待时间，urllib3 会不设上限地照做
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=Retry(
+        total=2, connect=0, read=False, backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504], raise_on_status=False,
+        respect_retry_after_header=False))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['Accept'] = 'application/json'
+    return session
+
+
 class OpenAIAPIClient:
+    __slots__ = ('base_url', 'api_key', '_headers', '_candidates', '_validators')
+    # 所有实例共享同一个连接池，刷新时免去重复的 TCP/TLS 握手；首次使用时创建
+    _session = None
+    _session_lock = threading.Lock()
+
     def __init__(self, base_url: str, api_key: str = None):
+        # endpoint -> (带条件头的请求头, 模型 ID)，用于条件请求
+        self._validators = {}
+        self.set_base_url(base_url)
+        self.set_api_key(api_key)
+
+    def set_base_url(self, base_url: str):
         self.base_url = base_url.strip()
+        base = self.base_url.rstrip('/')
+        # 未以 /v1 结尾的地址同时尝试补全 /v1
+        self._candidates = [(self.base_url, urljoin(base + '/', 'models'))]
+        if not base.endswith('/v1'):
+            self._candidates.append((base + '/v1', urljoin(base + '/v1/', 'models')))
+
+    def set_api_key(self, api_key: str = None):
         self.api_key = api_key.strip() if api_key else None
+        self._validators.clear()
+        # 会话为共享的，认证头按实例随请求发送
+        self._headers = {'Authorization': f'Bearer {self.api_key}'} if self.api_key else {}
+
+    @classmethod
+    def _get_session(cls):
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    cls._session = _build_session()
+        return cls._session
+
+    @classmethod
+    def close(cls):
+        if cls._session is not None:
+            cls._session.close()
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _validate_cached(url: str) -> bool:
+        return _URL_RE.match(url) is not None
 
     @staticmethod
     def validate_url(url: str) -> bool:
-        try:
-            parsed = urlparse(url.strip())
-            return parsed.scheme in ('http', 'https') and bool(parsed.netloc)
-        except Exception:
+        if not isinstance(url, str):
             return False
+        return OpenAIAPIClient._validate_cached(url.strip())
+
+    def use_base_url(self, url: str):
+        """固定使用探测成功的地址，之后的刷新直接请求它；只在 GUI 线程调用"""
+        self._candidates = [c for c in self._candidates if c[0] == url] or self._candidates
+        self.base_url = url
+
+    def fetch_models(self) -> tuple:
+        """返回 (可用地址, 模型 ID 列表)。
+
+        有补全 /v1 的候选端点时与输入的地址并发请求，但优先采用输入的地址，
+        只有它失败时才改用 /v1。在工作线程中运行，不修改客户端状态，
+        由调用方决定是否采用返回的地址。
+        """
+        # GUI 线程可能随时为新一轮获取调用 set_base_url，先取本地快照
+        candidates = self._candidates
+        url, endpoint = candidates[0]
+        if len(candidates) == 1:
+            return url, self._fetch_from(endpoint)
+
+        v1_url, v1_endpoint = candidates[1]
+        v1_future = _submit(self._fetch_from, v1_endpoint)
+        try:
+            ids = self._fetch_from(endpoint)
+        except APIError as e:
+            # /v1 请求仍在排队时直接在当前线程执行，不占着工作线程等待其它工作线程
+            try:
+                if v1_future.cancel():
+                    return v1_url, self._fetch_from(v1_endpoint)
+                return v1_url, v1_future.result()
+            except APIError:
+                raise e
+        v1_future.cancel()
+        return url, ids
+
+    def _fetch_from(self, endpoint: str) -> list:
+        import requests
+        from urllib3.exceptions import HTTPError as URLLib3Error, ReadTimeoutError
 
-    def fetch_models(self) -> dict:
         try:
-            endpoint = urljoin(self.base_url.rstrip('/') + '/', 'models')
-            headers = {'Accept': 'application/json'}
-            if self.api_key:
-                headers['Authorization'] = f'Bearer {self.api_key}'
-
-            resp = requests.get(endpoint, timeout=30, headers=headers)
-            
-            error_msgs = {401: "认证失败：API密钥无效或缺失",
-                         404: f"端点不存在：{endpoint}", 500: "服务器内部错误"}
-            if resp.status_code in error_msgs:
-                raise APIError(error_msgs[resp.status_code])
-            if resp.status_code != 200:
-                raise APIError(f"HTTP错误：状态码 {resp.status_code}")
-
-            data = resp.json()
-            if not isinstance(data.get('data'), list):
-                raise APIError("响应格式错误：缺少有效的'data'字段")
-            return data
-
-        except requests.exceptions.Timeout:
+            base_headers = self._headers
+            cached = self._validators.get(endpoint)
+            headers = cached[0] if cached else base_headers
+            with self._get_session().get(endpoint, headers=headers, timeout=(5, 30),
+                                         stream=ijson is not None) as resp:
+                if resp.status_code == 304 and cached:
+                    return list(cached[1])
+                status = resp.status_code
+                if status != 200:
+                    if status == 404:
+                        raise APIError(f"端点不存在：{endpoint}")
+                    raise APIError(_STATIC_ERRS.get(status) or f"HTTP错误：状态码 {status}")
+
+                if ijson is not None:
+                    resp.raw.decode_content = True
+                    ids = _stream_model_ids(resp.raw)
+                else:
+                    ids = _extract_model_ids(_loads(resp.content))
+
+                # 条件请求头在此一次性构建好，之后的刷新直接复用
+                conditional = {k: v for k, v in (('If-None-Match', resp.headers.get('ETag')),
+                                                 ('If-Modified-Since', resp.headers.get('Last-Modified'))) if v}
+                # 请求期间密钥已被替换时不再缓存，以免旧的认证头混入新一轮请求
+                if conditional and self._headers is base_headers:
+                    self._validators[endpoint] = ({**base_headers, **conditional}, tuple(ids))
+                return ids
+
+        except (requests.exceptions.Timeout, ReadTimeoutError):
             raise APIError("请求超时：连接超过30秒未响应")
         except requests.exceptions.ConnectionError as e:
             raise APIError(f"连接错误：{e}")
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, URLLib3Error) as e:
             raise APIError(f"网络请求错误：{e}")
-        except (ValueError, KeyError) as e:
+        except _PARSE_ERRORS as e:
             raise APIError(f"响应解析错误：{e}")
         except APIError:
             raise
@@ -80,83 +281,150 @@ class OpenAIAPIClient:
 
 
 class ConfigManager:
+    __slots__ = ('config_dir', '_cache', '_list_cache')
+
     def __init__(self):
-        self.config_dir = Path.home() / ".openai_model_fetcher"
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        self.config_dir = _CONFIG_DIR
+        self._cache = {}  # name -> ((mtime_ns, size), config)
+        self._list_cache = None  # (目录 mtime_ns, 配置名列表)
 
     def _get_path(self, name: str) -> Path:
         return self.config_dir / f"{name}.json"
 
     def save(self, name: str, url: str, api_key: str = None):
-        self._get_path(name).write_text(json.dumps({
+        # 内容未变时不重写文件，也不刷新 last_updated
+        if self.load(name) == {"base_url": url, "api_key": api_key or ""}:
+            return
+        from datetime import datetime
+        # 先写临时文件再原子替换，写入中途退出也不会损坏原配置
+        path = self._get_path(name)
+        tmp = path.with_suffix('.json.tmp')
+        tmp.write_bytes(_dumps({
             "base_url": url, "api_key": api_key or "",
             "last_updated": datetime.now().isoformat()
-        }, indent=2, ensure_ascii=False), encoding='utf-8')
+        }))
+        os.replace(tmp, path)
+        self._cache.pop(name, None)
+        self._list_cache = None
 
     def load(self, name: str) -> dict:
         try:
             path = self._get_path(name)
-            if path.exists():
-                data = json.loads(path.read_text(encoding='utf-8'))
-                return {"base_url": data.get("base_url"), "api_key": data.get("api_key", "")}
+            st = path.stat()
+            # 纳秒时间戳加文件大小，避免粗粒度 mtime 漏掉快速的连续写入
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._cache.get(name)
+            if cached and cached[0] == key:
+                return dict(cached[1])
+            data = _loads(path.read_bytes())
+            config = {"base_url": data.get("base_url"), "api_key": data.get("api_key", "")}
+            self._cache[name] = (key, config)
+            return dict(config)
         except Exception:
             pass
         return {"base_url": None, "api_key": None}
 
     def delete(self, name: str):
         self._get_path(name).unlink(missing_ok=True)
+        self._cache.pop(name, None)
+        self._list_cache = None
 
     def list_profiles(self) -> list:
-        return [p.stem for p in self.config_dir.glob("*.json")]
+        # 目录未变化时直接复用上次的扫描结果
+        mtime = self.config_dir.stat().st_mtime_ns
+        if self._list_cache and self._list_cache[0] == mtime:
+            return list(self._list_cache[1])
+        with os.scandir(self.config_dir) as it:
+            profiles = [e.name[:-5] for e in it if e.name.endswith('.json') and e.is_file()]
+        self._list_cache = (mtime, profiles)
+        return list(profiles)
 
     def clear_all(self):
-        for p in self.config_dir.glob("*.json"):
-            p.unlink(missing_ok=True)
+        with os.scandir(self.config_dir) as it:
+            for e in it:
+                if e.name.endswith('.json') and e.is_file():
+                    try:
+                        os.unlink(e.path)
+                    except FileNotFoundError:
+                        pass
+        self._cache.clear()
+        self._list_cache = None
 
 
 class WorkerSignals(QObject):
-    success = Signal(dict)
-    error = Signal(str)
+    # 首个参数为请求序号，用于丢弃已被新请求取代的结果
+    # 结果声明为 object，跨线程按引用传递，不逐项转换为 QVariantList
+    success = Signal(int, object)
+    error = Signal(int, str)
+
 
+class ModelListModel(QAbstractListModel):
+    """模型 ID 列表的数据模型，视图只为可见行绘制"""
+    # 预先转为小写的 ID，供筛选使用
+    FILTER_ROLE = Qt.UserRole + 1
 
-class ModelCard(CardWidget):
-    def __init__(self, model_id: str, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.model_id = model_id
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(16, 12, 16, 12)
+        self._ids, self._lower = [], []
 
-        label = BodyLabel(f"○ {model_id}")
-        label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+    def ids(self) -> list:
+        return self._ids
 
-        copy_btn = PushButton("Copy")
-        copy_btn.setFixedWidth(80)
-        copy_btn.clicked.connect(self._copy)
+    def set_ids(self, ids: list):
+        self.beginResetModel()
+        self._ids = list(ids)
+        self._lower = [str(m).lower() for m in self._ids]
+        self.endResetModel()
 
-        layout.addWidget(label)
-        layout.addWidget(copy_btn)
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
 
-    def _copy(self):
-        QApplication.clipboard().setText(self.model_id)
-        InfoBar.success("已复制", self.model_id, parent=self.window(),
-                       position=InfoBarPosition.TOP_RIGHT, duration=2000)
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return f"○ {self._ids[index.row()]}"
+        if role == self.FILTER_ROLE:
+            return self._lower[index.row()]
+        return None
 
 
 class HomePage(QWidget):
-    def __init__(self, parent=None):
+    # 错误信息关键字 -> 处理提示，按顺序匹配
+    _ERROR_HINTS = (("超时", "检查网络连接"), ("连接", "检查URL是否可访问"), ("401", "检查API密钥"),
+                    ("404", "确认BaseURL正确"), ("500", "服务器问题，稍后重试"))
+
+    def __init__(self, parent=None, config: ConfigManager = None):
         super().__init__(parent)
         self.setObjectName("homePage")
-        self.config = ConfigManager()
-        self.model_ids, self.model_cards, self.all_models = [], [], []
+        self.config = config or ConfigManager()
+        self.model_store = ModelListModel(self)
+        self.model_proxy = QSortFilterProxyModel(self)
+        self.model_proxy.setSourceModel(self.model_store)
+        self.model_proxy.setFilterRole(ModelListModel.FILTER_ROLE)
+        self.model_proxy.setFilterCaseSensitivity(Qt.CaseSensitive)
         self.signals = WorkerSignals()
+        self._clipboard = QApplication.clipboard()
+        self.api_client = None
+        self._fetch_gen, self._pending_future = 0, None
         self.current_profile = "default"
+        # 构建界面的同时在后台读取配置
+        self._cfg_future = _submit(self.config.load, self.current_profile)
         self._setup_ui()
         self._connect()
         self._load_config()
         self._setup_shortcuts()
 
     def _setup_shortcuts(self):
-        QShortcut(QKeySequence(Qt.Key_F5), self, self._fetch)
+        # 合并连续按下的 F5（含按住自动重复），只触发一次获取
+        self._f5_timer = QTimer(self)
+        self._f5_timer.setSingleShot(True)
+        self._f5_timer.setInterval(200)
+        self._f5_timer.timeout.connect(self._fetch)
+        QShortcut(QKeySequence(Qt.Key_F5), self, self._f5_timer.start)
+        copy = QShortcut(QKeySequence.Copy, self.model_list,
+                         lambda: self._copy_model(self._model_id_at(self.model_list.currentIndex())))
+        copy.setContext(Qt.WidgetShortcut)
 
     def _setup_ui(self):
         main = QVBoxLayout(self)
@@ -214,7 +482,12 @@ class HomePage(QWidget):
         self.search_box = SearchLineEdit()
         self.search_box.setPlaceholderText("搜索模型...")
         self.search_box.setFixedWidth(200)
-        self.search_box.textChanged.connect(self._filter_models)
+        # 输入停顿 150ms 后再筛选，连续输入只触发一次
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._filter_models)
+        self.search_box.textChanged.connect(lambda _: self._filter_timer.start())
         header.addWidget(self.search_box)
         
         self.export_btn = PushButton("导出")
@@ -222,24 +495,23 @@ class HomePage(QWidget):
         self.export_btn.setEnabled(False)
         header.addWidget(self.export_btn)
 
-        self.scroll_area = ScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setMinimumHeight(250)
-        self.scroll_area.setStyleSheet("""
-            ScrollArea { background-color: #2d2d2d; border-radius: 8px; border: none; }
-            QScrollBar:vertical { width: 8px; background: transparent; }
-            QScrollBar::handle:vertical { background: #555; border-radius: 4px; }
-        """)
-
-        self.scroll_content = QWidget()
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_layout.setContentsMargins(8, 8, 8, 8)
-        self.scroll_layout.setSpacing(8)
-        self.scroll_layout.addStretch()
-        self.scroll_area.setWidget(self.scroll_content)
+        # 单个列表视图承载全部模型，经代理模型筛选；双击或右键复制
+        self.model_list = ListView()
+        self.model_list.setModel(self.model_proxy)
+        self.model_list.setMinimumHeight(250)
+        # 行高一致，免去逐项测量；大列表分批布局，避免界面卡顿
+        self.model_list.setUniformItemSizes(True)
+        self.model_list.setLayoutMode(ListView.Batched)
+        self.model_list.setBatchSize(200)
+        # 右键菜单只创建一次，之后复用
+        self._menu_model_id = None
+        self.model_menu = RoundMenu(parent=self)
+        self.model_menu.addAction(Action(FluentIcon.COPY, "复制",
+                                         triggered=lambda: self._copy_model(self._menu_model_id)))
+        self.model_list.setContextMenuPolicy(Qt.CustomContextMenu)
 
         res.addLayout(header)
-        res.addWidget(self.scroll_area)
+        res.addWidget(self.model_list)
 
         main.addWidget(input_card)
         main.addLayout(btn_layout)
@@ -249,20 +521,31 @@ class HomePage(QWidget):
         self.fetch_btn.clicked.connect(self._fetch)
         self.refresh_btn.clicked.connect(self._fetch)
         self.export_btn.clicked.connect(self._export)
+        self.model_list.doubleClicked.connect(
+            lambda index: self._copy_model(self._model_id_at(index)))
+        self.model_list.customContextMenuRequested.connect(self._show_model_menu)
         self.url_entry.returnPressed.connect(self._fetch)
         self.key_entry.returnPressed.connect(self._fetch)
         self.signals.success.connect(self._on_success)
         self.signals.error.connect(self._on_error)
 
-    def _filter_models(self, text: str):
-        text = text.lower().strip()
-        self._clear_model_cards()
-        filtered = [m for m in self.all_models if text in m.lower()] if text else self.all_models
-        for model_id in filtered:
-            self._add_model_card(model_id)
-        self.model_ids = filtered
+    def _filter_models(self):
+        # 查询只转一次小写，与预存的小写 ID 按区分大小写比较
+        self.model_proxy.setFilterFixedString(self.search_box.text().strip().lower())
+
+    def _visible_model_ids(self) -> list:
+        proxy, ids = self.model_proxy, self.model_store.ids()
+        return [ids[proxy.mapToSource(proxy.index(row, 0)).row()] for row in range(proxy.rowCount())]
+
+    def _model_id_at(self, index):
+        if not index.isValid():
+            return None
+        return self.model_store.ids()[self.model_proxy.mapToSource(index).row()]
 
     def _fetch(self):
+        # 与禁用的按钮一致，获取进行中时忽略回车和 F5
+        if self._pending_future is not None:
+            return
         url = self.url_entry.text().strip()
         if not url:
             return self._show_validation("请输入BaseURL")
@@ -274,66 +557,117 @@ class HomePage(QWidget):
         self._notify("正在获取模型列表...", "info")
         self._clear_models()
 
-        def worker():
-            try:
-                result = OpenAIAPIClient(url, self.key_entry.text().strip()).fetch_models()
-                self.signals.success.emit(result)
-            except APIError as e:
-                self.signals.error.emit(str(e))
-
-        threading.Thread(target=worker, daemon=True).start()
-
-    def _on_success(self, result: dict):
+        gen = self._supersede_fetch()
+        client = self._get_client(url, self.key_entry.text().strip())
+        self._pending_future = _submit(client.fetch_models)
+        self._pending_future.add_done_callback(lambda f: self._on_fetch_done(f, gen))
+
+    def _supersede_fetch(self) -> int:
+        # 作废进行中的获取，其结果返回时按代数丢弃
+        if self._pending_future is not None:
+            self._pending_future.cancel()
+            self._pending_future = None
+        self._fetch_gen += 1
+        return self._fetch_gen
+
+    def _on_fetch_done(self, future, gen: int):
+        # 在工作线程中回调，通过信号转交给 GUI 线程；任何异常都要回报，否则界面会一直停在加载状态
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except APIError as e:
+            self.signals.error.emit(gen, str(e))
+        except Exception as e:
+            self.signals.error.emit(gen, f"未知错误：{e}")
+        else:
+            self.signals.success.emit(gen, result)
+
+    def _get_client(self, url: str, api_key: str) -> OpenAIAPIClient:
+        # 始终复用同一个客户端，连接池跨刷新保留
+        client = self.api_client
+        if client is None:
+            client = self.api_client = OpenAIAPIClient(url, api_key)
+        else:
+            if client.base_url != url:
+                client.set_base_url(url)
+            if client.api_key != (api_key or None):
+                client.set_api_key(api_key)
+        return client
+
+    def close_client(self):
+        if self.api_client is not None:
+            self.api_client.close()
+            self.api_client = None
+
+    def _on_success(self, gen: int, result: tuple):
+        if gen != self._fetch_gen:
+            return
+        self._pending_future = None
         self._set_loading(False)
-        models = result.get("data", [])
-        if not models:
+        url, model_ids = result
+        if not model_ids:
             return self._notify("未找到任何模型", "warning")
 
-        self.all_models = [m.get("id", "Unknown") for m in models]
-        for model_id in self.all_models:
-            self._add_model_card(model_id)
-        self.model_ids = self.all_models.copy()
-        self._notify(f"成功获取 {len(models)} 个模型", "success")
+        # 探测到的可用地址回填到输入框，随配置一并保存；之后的刷新直接请求它
+        self.api_client.use_base_url(url)
+        if url != self.url_entry.text().strip():
+            self.url_entry.setText(url)
+
+        self._add_models_bulk(model_ids)
+        self._notify(f"成功获取 {len(model_ids)} 个模型", "success")
         self.config.save(self.current_profile, self.url_entry.text().strip(), 
                         self.key_entry.text().strip())
 
-    def _on_error(self, msg: str):
+    def _on_error(self, gen: int, msg: str):
+        if gen != self._fetch_gen:
+            return
+        self._pending_future = None
         self._set_loading(False)
-        hints = {"超时": "检查网络连接", "连接": "检查URL是否可访问", "401": "检查API密钥",
-                 "404": "确认BaseURL正确", "500": "服务器问题，稍后重试"}
-        hint = next((v for k, v in hints.items() if k in msg), "检查BaseURL和网络")
+        hint = next((v for k, v in self._ERROR_HINTS if k in msg), "检查BaseURL和网络")
         InfoBar.error("错误", f"{msg}\n提示: {hint}", parent=self.window(),
                      position=InfoBarPosition.TOP_RIGHT, duration=5000)
 
     def _export(self):
-        if not self.model_ids:
+        model_ids = self._visible_model_ids()
+        if not model_ids:
             return InfoBar.warning("提示", "没有可导出的模型", parent=self.window(),
                                   position=InfoBarPosition.TOP_RIGHT, duration=3000)
         try:
+            from datetime import datetime
             filename = f"model_ids_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-            Path(filename).write_text('\n'.join(self.model_ids), encoding='utf-8')
+            Path(filename).write_text('\n'.join(model_ids) + '\n', encoding='utf-8')
             InfoBar.success("导出成功", f"已导出到 {filename}", parent=self.window(),
                            position=InfoBarPosition.TOP_RIGHT, duration=4000)
         except Exception as e:
             InfoBar.error("导出失败", str(e), parent=self.window(),
                          position=InfoBarPosition.TOP_RIGHT, duration=4000)
 
-    def _add_model_card(self, model_id: str):
-        card = ModelCard(model_id)
-        self.model_cards.append(card)
-        self.scroll_layout.insertWidget(self.scroll_layout.count() - 1, card)
-        self.export_btn.setEnabled(True)
+    def _add_models_bulk(self, model_ids: list):
+        if model_ids:
+            self.model_store.set_ids(model_ids)
+            self.export_btn.setEnabled(True)
 
-    def _clear_model_cards(self):
-        for c in self.model_cards:
-            c.deleteLater()
-        self.model_cards.clear()
+    def _copy_model(self, model_id: str):
+        if model_id is not None:
+            self._clipboard.setText(model_id)
+            InfoBar.success("已复制", model_id, parent=self.window(),
+                           position=InfoBarPosition.TOP_RIGHT, duration=2000)
+
+    def _show_model_menu(self, pos):
+        self._menu_model_id = self._model_id_at(self.model_list.indexAt(pos))
+        if self._menu_model_id is None:
+            return
+        self.model_menu.exec(self.model_list.viewport().mapToGlobal(pos))
 
     def _clear_models(self):
-        self._clear_model_cards()
-        self.model_ids.clear()
-        self.all_models.clear()
+        self.model_store.set_ids([])
+        # 列表已清空，屏蔽 textChanged 以免再触发一轮筛选，直接重置代理的筛选条件
+        self.search_box.blockSignals(True)
         self.search_box.clear()
+        self.search_box.blockSignals(False)
+        self._filter_timer.stop()
+        self.model_proxy.setFilterFixedString("")
         self.export_btn.setEnabled(False)
 
     def _set_loading(self, loading: bool):
@@ -350,7 +684,8 @@ class HomePage(QWidget):
                                 position=InfoBarPosition.TOP_RIGHT, duration=3000)
 
     def _load_config(self):
-        cfg = self.config.load(self.current_profile)
+        future, self._cfg_future = self._cfg_future, None
+        cfg = future.result() if future else self.config.load(self.current_profile)
         if cfg.get("base_url"):
             self.url_entry.setText(cfg["base_url"])
             if cfg.get("api_key"):
@@ -359,6 +694,8 @@ class HomePage(QWidget):
 
     def switch_profile(self, name: str):
         self.current_profile = name
+        self._supersede_fetch()
+        self._set_loading(False)
         self._clear_models()
         self._load_config()
 
@@ -366,10 +703,11 @@ class HomePage(QWidget):
 class ProfilesPage(QWidget):
     profile_switched = Signal(str)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, config: ConfigManager = None):
         super().__init__(parent)
         self.setObjectName("profilesPage")
-        self.config = ConfigManager()
+        self.config = config or ConfigManager()
+        self._profile_widgets = {}  # 配置名 -> 列表中的卡片
         self._setup_ui()
 
     def _setup_ui(self):
@@ -447,39 +785,44 @@ class ProfilesPage(QWidget):
                        position=InfoBarPosition.TOP_RIGHT, duration=3000)
 
     def _refresh_list(self):
-        # 清空列表
-        for i in reversed(range(self.profile_layout.count() - 1)):
-            w = self.profile_layout.itemAt(i).widget()
-            if w:
-                w.deleteLater()
-
         profiles = self.config.list_profiles()
         if not profiles:
             profiles = ["默认"]
             self.config.save("默认", "", "")
 
-        for name in profiles:
-            card = CardWidget()
-            row = QHBoxLayout(card)
-            row.setContentsMargins(12, 8, 12, 8)
-
-            label = BodyLabel(f"📁 {name}")
-            label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-
-            use_btn = PushButton("使用")
-            use_btn.setFixedWidth(60)
-            use_btn.clicked.connect(lambda _, n=name: self._use_profile(n))
+        # 只增删有变化的卡片，其余保持不动
+        new = set(profiles)
+        for name in set(self._profile_widgets) - new:
+            card = self._profile_widgets.pop(name)
+            self.profile_layout.removeWidget(card)
+            card.deleteLater()
+        for i, name in enumerate(sorted(new)):
+            if name not in self._profile_widgets:
+                card = self._make_profile_card(name)
+                self._profile_widgets[name] = card
+                self.profile_layout.insertWidget(i, card)
+
+    def _make_profile_card(self, name: str) -> CardWidget:
+        card = CardWidget()
+        row = QHBoxLayout(card)
+        row.setContentsMargins(12, 8, 12, 8)
+
+        label = BodyLabel(f"📁 {name}")
+        label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
-            del_btn = PushButton("删除")
-            del_btn.setIcon(FluentIcon.DELETE)
-            del_btn.setFixedWidth(80)
-            del_btn.clicked.connect(lambda _, n=name: self._delete_profile(n))
+        use_btn = PushButton("使用")
+        use_btn.setFixedWidth(60)
+        use_btn.clicked.connect(lambda _, n=name: self._use_profile(n))
 
-            row.addWidget(label)
-            row.addWidget(use_btn)
-            row.addWidget(del_btn)
+        del_btn = PushButton("删除")
+        del_btn.setIcon(FluentIcon.DELETE)
+        del_btn.setFixedWidth(80)
+        del_btn.clicked.connect(lambda _, n=name: self._delete_profile(n))
 
-            self.profile_layout.insertWidget(self.profile_layout.count() - 1, card)
+        row.addWidget(label)
+        row.addWidget(use_btn)
+        row.addWidget(del_btn)
+        return card
 
     def _use_profile(self, name: str):
         self.profile_switched.emit(name)
@@ -497,10 +840,10 @@ class ProfilesPage(QWidget):
 
 
 class SettingsPage(QWidget):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, config: ConfigManager = None):
         super().__init__(parent)
         self.setObjectName("settingsPage")
-        self.config = ConfigManager()
+        self.config = config or ConfigManager()
         self._setup_ui()
 
     def _setup_ui(self):
@@ -574,9 +917,11 @@ class MainWindow(FluentWindow):
         setTheme(Theme.DARK)
         self.navigationInterface.setExpandWidth(140)
 
-        self.home_page = HomePage(self)
-        self.profiles_page = ProfilesPage(self)
-        self.settings_page = SettingsPage(self)
+        # 各页面共用一个配置管理器，共享其缓存
+        self.config = ConfigManager()
+        self.home_page = HomePage(self, config=self.config)
+        self.profiles_page = ProfilesPage(self, config=self.config)
+        self.settings_page = SettingsPage(self, config=self.config)
 
         # 连接配置切换信号
         self.profiles_page.profile_switched.connect(self.home_page.switch_profile)
@@ -587,13 +932,21 @@ class MainWindow(FluentWindow):
         
         self.navigationInterface.addItem(
             routeKey="github", icon=FluentIcon.GITHUB, text="GitHub",
-            onClick=lambda: webbrowser.open('https://github.com/GamblerIX/OpenAI_Model_Fetcher/'),
+            onClick=self._open_github,
             position=NavigationItemPosition.BOTTOM
         )
         self.addSubInterface(self.settings_page, FluentIcon.SETTING, "设置",
                             position=NavigationItemPosition.BOTTOM)
         self.navigationInterface.setCurrentItem(self.home_page.objectName())
 
+    def _open_github(self):
+        import webbrowser
+        webbrowser.open('https://github.com/GamblerIX/OpenAI_Model_Fetcher/')
+
+    def closeEvent(self, event):
+        self.home_page.close_client()
+        super().closeEvent(event)
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)